@@ -98,6 +98,37 @@ Once running:
 • Database Init: Ensures all tables exist before handling requests
 • Router Registration: Connects /api/chat endpoint to handler function
 
+─────────────────────────────────────────────────────────────────────────
+⚡ PERFORMANCE SETUP:
+─────────────────────────────────────────────────────────────────────────
+Startup warm-up: the first query otherwise pays for loading the ML classifier and the
+embedding model (hundreds of ms to seconds). Do it at boot instead:
+
+    @app.on_event("startup")
+    async def warm_up():
+        from core.classifier import classify
+        from core.embeddings import embed_query
+        from core.rag import get_rag_system
+        from db.session import engine
+        classify("hi")          # loads the ML pipeline
+        embed_query("hi")       # loads the sentence-transformer
+        # opens ChromaDB, runs one encode, pages in the HNSW index
+        get_rag_system().search_documents("warmup", top_k=1)
+        with engine.connect():  # opens the first DB connection
+            pass
+
+• Runs once per worker (uvicorn --workers N warms every worker)
+• get_rag_system() is a singleton: the warm-up instance is the one
+  every request reuses, so the 2-5s ChromaDB + model load never lands
+  on a user
+• Same idea for the LLM client: create the ResponseGenerator singleton
+  here too, so its HuggingFace client is built before the first question
+• Slower boot, but no slow first answer for a real user
+
+JSON responses: FastAPI(default_response_class=ORJSONResponse)
+(from fastapi.responses, needs the orjson package) serializes every
+response with orjson, which is several times faster than stdlib json.
+
 ─────────────────────────────────────────────────────────────────────────
 📎 IMPORTANT REMINDERS:
 ─────────────────────────────────────────────────────────────────────────
@@ -119,6 +119,9 @@ Example 3: No Data Found (Fallback)
 🔑 KEY COMPONENTS:
 ─────────────────────────────────────────────────────────────────────────
 1. ChatRequest/ChatResponse - Pydantic models for validation
+   • Pydantic v2 BaseModel with model_config = ConfigDict(frozen=True,
+     extra="forbid"): validation runs in the Rust core, and unknown
+     fields are rejected instead of copied around
 2. chat() - Main endpoint function
 3. Handler Functions:
    • try_get_contact() - Search contact databases
@@ -148,11 +151,89 @@ def try_get_X(text: str, session) -> Optional[str]:
     4. Format as string
     5. Return data OR None
 
+Step 3 (validate) tip: compare names with rapidfuzz, not difflib or a
+hand-written loop. It is compiled C++ and much faster:
+
+    from rapidfuzz import fuzz, process
+    best = process.extractOne(keyword, [r.name for r in rows],
+                              scorer=fuzz.WRatio, score_cutoff=75)
+    if best:
+        name, score, index = best
+        row = rows[index]
+
+Read-only lookups that only format rows into text don't need full ORM
+objects. Fetch plain rows and build models without re-validating them:
+
+    rows = session.execute(select(Faculty.__table__).where(...)).all()
+    faculty = rows_to_models(FacultyRead, rows)   # db/session.py, db/models.py
+
+(Safe only because the data comes from our own database.)
+
 This decouples data retrieval from response formatting!
 
+⚡ ASYNC VERSION (recommended):
+─────────────────────────────────────────────────────────────────────────
+A plain `def chat()` blocks a worker thread on every DB query and every
+Mistral call. Write the endpoint and handlers as `async def` instead:
+
+async def chat(req: ChatRequest,
+               session: AsyncSession = Depends(get_async_session)):
+    ...
+
+async def try_get_X(text: str, session: AsyncSession) -> Optional[str]:
+    result = await session.execute(
+        select(Canteen).where(Canteen.name.ilike(f"%{kw}%"))
+    )
+    ...
+
+• get_async_session / AsyncSessionLocal live in db/session.py
+• Call HuggingFace with an awaited HTTP client (httpx.AsyncClient)
+• While one request waits on I/O, the worker serves other users
+
+Multi-intent queries ("Roy canteen phone and location"):
+    handlers = {"db_contact": try_get_contact,
+                "db_location": try_get_location,
+                "faculty_info": try_get_faculty}
+    tasks = [handlers[i](text, session)
+             for i, score in result.all_intents.items()
+             if i in handlers and score > 0.25]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    parts = [r for r in results if isinstance(r, str)]
+
+• Lookups run at the same time: wait = slowest handler, not the sum
+• return_exceptions=True: one failing lookup doesn't sink the others
+• Give each task its own session (an AsyncSession is not safe to
+  share between concurrent awaits)
+
+Speculative lookups (only worth it when use_llm=True, ~1-2s classify):
+    rag_task = asyncio.create_task(try_get_rag(text))
+    contact_task = asyncio.create_task(try_get_contact(text, session))
+    result = await classify_detailed_async(text)
+    winner = {"rag": rag_task,
+              "db_contact": contact_task}.get(result.primary_intent)
+    for task in (rag_task, contact_task):
+        if task is not winner:
+            task.cancel()
+    answer = await winner if winner else None
+
+• Retrieval starts while classification is still running:
+  total wait = max(classify, retrieve) instead of classify + retrieve
+• The cancelled lookup is wasted work; skip this on the fast
+  keyword/ML path where classification takes milliseconds
+
 🚨 ERROR HANDLING:
 ─────────────────────────────────────────────────────────────────────────
 • Empty query → Friendly prompt
+  - Check it FIRST in chat(), before the classifier runs:
+      norm = (req.text or "").strip().lower()
+      if not norm:
+          return {"answer": PROMPT_MSG, "intent": "empty", "confidence": 1.0}
+  - Same shortcut for one-word greetings, answered from a dict built
+    at import (SMALL_TALK = {"hi": ..., "hello": ..., "thanks": ...}):
+      if norm in SMALL_TALK:
+          return {"answer": SMALL_TALK[norm], "intent": "small_talk",
+                  "confidence": 1.0}
+    No classifier, database or LLM work for greetings
 • Classification error → AI fallback
 • Database error → Error message + log
 • Formatting error → Return raw data
@@ -162,6 +243,10 @@ This decouples data retrieval from response formatting!
 ─────────────────────────────────────────────────────────────────────────
 • Always close database session (finally block)
 • Extensive debug logging for troubleshooting
+  - Use lazy formatting: logger.debug("intent=%s conf=%.2f", intent, conf)
+    An f-string is built even when DEBUG is off; "%s" args are not
+  - Costly debug-only work (dumping dicts, etc.): check once at import
+    _DEBUG = logger.isEnabledFor(logging.DEBUG) and wrap it in if _DEBUG:
 • Response always includes: answer, intent, confidence
 • RAG results truncated to prevent huge responses (500 chars/chunk)
 • Fallback always provides helpful response (never "I don't know")
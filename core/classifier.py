@@ -101,6 +101,33 @@ When it fails:
   ✗ Typos: "phoen number"
   ✗ Complex: "How do I get in touch with food services"
 
+Scanning many keywords at once:
+  • Avoid "for kw in keywords: if kw in text" for every intent
+    (cost grows with the number of keywords)
+  • Build ONE Aho–Corasick automaton at import (pyahocorasick):
+      A = ahocorasick.Automaton()
+      for intent, kws in KEYWORDS.items():
+          for kw in kws:
+              A.add_word(kw.lower(), (intent, len(kw)))
+      A.make_automaton()
+  • Score in a single pass:
+      for _, (intent, weight) in A.iter(text.lower()):
+          scores[intent] += weight
+  • Longer keywords weigh more: "phone number" beats "phone"
+
+Regex hints (when you need word boundaries like r"\\broom\\b"):
+  • Compile ONCE at module level, never inside the function
+  • Fuse all hint patterns into one alternation with named groups:
+      _INTENT_RX = re.compile(
+          r"(?P<db_contact>\\b(?:phone|email|contact)\\b)"
+          r"|(?P<db_location>\\b(?:where|located|room)\\b)",
+          re.IGNORECASE,
+      )
+  • Tally in one scan:
+      for m in _INTENT_RX.finditer(text):
+          scores[m.lastgroup] += 1
+  • Plain substrings? Prefer the automaton above
+
 LEVEL 2: MACHINE LEARNING (TF-IDF + Logistic Regression)
 ─────────────────────────────────────────────────────────
 Speed:       ⚡ 0.01 seconds (fast)
@@ -125,6 +152,19 @@ What it learns:
   ✓ Synonyms: "reach" = "contact" = "call"
   ✓ Patterns: "How to [verb]" → rag
 
+Fast setup (recommended):
+  • Build the model offline as ONE sklearn Pipeline:
+      HashingVectorizer(analyzer="char_wb", ngram_range=(3, 5),
+                        n_features=2**14, alternate_sign=False)
+      → TfidfTransformer → LogisticRegression(solver="liblinear", C=4)
+  • Save it: joblib.dump(pipeline, "models/intent_pipeline.joblib")
+  • Load it ONCE at module import:
+      _ML_PIPELINE = joblib.load("models/intent_pipeline.joblib",
+                                 mmap_mode="r")
+  • Predict with _ML_PIPELINE.predict_proba([text])[0]
+  • Hashing skips the vocabulary dict lookup for every token
+  • Char n-grams also catch typos: "phoen" still looks like "phone"
+
 LEVEL 3: LARGE LANGUAGE MODEL (Mistral-7B via HuggingFace)
 ───────────────────────────────────────────────────────────
 Speed:       🐌 1-2 seconds (slow)
@@ -155,6 +195,13 @@ STEP 1: Keyword Classification
   Found: "phone" → db_contact (0.85)
   Found: "location" → db_location (0.80)
 
+  Fast path (skip STEP 2 and 3):
+    If the top keyword score ≥ 0.85 AND it beats the runner-up by ≥ 0.2,
+    ML can't change the winner → return the keyword result right away.
+    Not here: 0.85 vs 0.80 is too close, so ML still runs.
+    Keep the other keyword scores in all_intents so STEP 4 still works.
+    Likewise, only call the LLM when the combined score is < 0.7.
+
 STEP 2: ML Classification
   Probabilities:
     • db_contact: 0.78
@@ -255,6 +302,8 @@ Confidence Interpretation:
 LLM Usage:
   use_llm=False: Default (fast, free)
   use_llm=True:  Only for complex queries (slow, costs)
+  Repeated prompts: enable LangChain's LLM cache (set_llm_cache,
+  see core/fallback_message.py) so they skip the API round-trip
 
 Training Data:
   • 40+ examples per intent
@@ -279,6 +328,26 @@ Memory Usage:
   • ML model: ~5MB
   • LLM: API-based (no local memory)
 
+Result Caching:
+  • Chat traffic repeats a lot ("hi", "canteen phone", retries)
+  • Put the pure pipeline in _classify_cached(normalized_text, use_llm)
+    decorated with @functools.lru_cache(maxsize=4096)
+  • classify_detailed() normalizes first: strip, lower, collapse
+    whitespace with a module-level re.compile(r"\\s+"), then delegates
+  • ClassificationResult should be frozen so cached results can be
+    shared safely between requests
+  • Do not cache a result when the LLM call failed (HF API hiccup)
+  • Repeat query: ~10ms → a few microseconds
+  • _classify_cached.cache_info() shows hits/misses for debugging
+
+Batch Scoring (reports, cache warm-up):
+  • Don't call classify() in a loop over hundreds of queries
+  • classify_many(texts) can vectorize ALL texts in one call:
+      X = _ML_PIPELINE[:-1].transform(texts)       # one sparse matrix
+      P = _ML_PIPELINE[-1].predict_proba(X)        # one matrix multiply
+      return [combine(keyword_scores(t), p) for t, p in zip(texts, P)]
+  • Keyword pass stays per text (it is already ~1ms)
+
 💻 USAGE:
 ─────────────────────────────────────────────────────────────────────────
 
@@ -297,6 +366,11 @@ Detailed Classification (full info):
     print(f"Multi-intent: {result.is_multi_intent}")
     print(f"All intents: {result.all_intents}")
 
+    # ClassificationResult is internal-only, so a plain dataclass is enough:
+    #   @dataclass(frozen=True, slots=True)
+    #   all_intents as a tuple of (intent, score) pairs, not a dict
+    # Frozen + tuples = hashable (safe to cache), slots = no per-object __dict__
+
 With LLM (for complex queries):
     result = classify_detailed(
         "I need to get in touch with food services",
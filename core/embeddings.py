@@ -17,6 +17,42 @@ Why Embeddings?
 - Each text becomes a 384-number vector
 - Similar meanings = similar vectors
 - Enables "smart" search that understands context
+
+Performance Tips:
+- Load the SentenceTransformer ONCE at module level (_ENCODER) and reuse it
+- Ingestion: encode all chunks in one call
+  (_ENCODER.encode(chunks, batch_size=64, normalize_embeddings=True,
+  convert_to_numpy=True)) and store them with a single collection.add()
+- Queries: memoize the query embedding with functools.lru_cache(maxsize=1024)
+  keyed on the normalized query text; return a tuple so it stays immutable
+- Small corpus, exact search: a FAISS IndexFlatIP(384) over normalized
+  float32 vectors is one matrix-vector product per query. Persist it with
+  faiss.write_index() and keep chunk texts in a parallel file; query with
+  index.search(q, k). Past ~100K chunks, IndexIVFPQ trades a little recall
+  for ~8x less memory
+- CPU-only servers: export MiniLM to ONNX once
+  (optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 out/),
+  quantize with onnxruntime.quantization.quantize_dynamic(..., QuantType.QInt8)
+  and run it through onnxruntime.InferenceSession. Wrap it in a class with
+  the same encode(list[str]) -> np.ndarray signature (fast AutoTokenizer,
+  mean-pool, L2-normalize) so it drops in for _ENCODER
+- On a GPU, run the encoder in half precision: SentenceTransformer(...,
+  model_kwargs={"torch_dtype": torch.float16}) or _ENCODER.half() after
+  loading (bfloat16 on CPUs with AVX-512 BF16). Campus queries are short,
+  so _ENCODER.max_seq_length = 64 for the query encoder also helps
+- Encoding a mixed batch of short and long texts? Each batch is padded
+  to its longest member, so one long text makes every short one pay.
+  Count tokens with the fast (Rust) AutoTokenizer, group texts into
+  buckets of <=16 / <=32 / <=64 tokens, encode each bucket on its own
+  (padding="longest", max_length = bucket size), then put the vectors
+  back in the original order. sentence-transformers already sorts by
+  length inside one encode() call, so this matters most for a custom
+  ONNX encoder or a request batcher
+- Similarity search: never loop over chunks in Python. With normalized
+  float32 vectors, scores = matrix @ query, then take the top k with
+  np.argpartition(-scores, k)[:k] and sort only those k. If you need a custom
+  loop (e.g. fused scoring + filtering), write it with
+  @numba.njit(parallel=True, fastmath=True, cache=True) and numba.prange
 """
 
 # ===========================================================================
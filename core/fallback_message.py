@@ -73,6 +73,37 @@ Parameters:
     - 1.0 = creative (different answers)
     - 0.7 = balanced (recommended)
 
+Performance:
+  • Create the HuggingFaceEndpoint ONCE and reuse it:
+      _LLM = None
+      def _get_llm():
+          global _LLM
+          if _LLM is None:
+              _LLM = HuggingFaceEndpoint(repo_id=..., max_new_tokens=200,
+                                         temperature=0.7)
+          return _LLM
+    Rebuilding it per call repeats the TLS handshake and config validation
+  • Put the model call in a small pure function, e.g. _generate(prompt),
+    and wrap THAT in @functools.lru_cache(maxsize=512): off-topic
+    questions ("what's the weather?") repeat a lot
+  • Don't cache the friendly error message returned when the API fails
+  • Or cache at the LangChain layer for EVERY LLM call in the process
+    (this fallback + the Level 3 classifier), once at startup:
+      from langchain_core.globals import set_llm_cache
+      from langchain_community.cache import SQLiteCache
+      set_llm_cache(SQLiteCache(database_path=".llm_cache.db"))
+    Identical prompt + params → answered from SQLite, no API call.
+    Several uvicorn workers? Use RedisCache so they share one cache
+  • No network at all (optional): run a 4-bit GGUF build of the same
+    model locally with llama-cpp-python:
+      from llama_cpp import Llama
+      _LLM = Llama(model_path="models/mistral-7b-instruct-v0.2.Q4_K_M.gguf",
+                   n_ctx=1024, n_threads=os.cpu_count(), n_gpu_layers=-1)
+      out = _LLM.create_chat_completion(messages=[...], max_tokens=200,
+                                        temperature=0.7)
+    ~100-300 ms for short prompts and no rate limits, but needs ~4-5GB
+    RAM. Pick local vs HuggingFace with an env flag in .env
+
 
 Usage Example
 ──────────────────────────────────────────────────────────────────────────
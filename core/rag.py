@@ -72,6 +72,8 @@ STEP 2: Query Embedding
 STEP 3: Similarity Search in ChromaDB
   • Compare query vector with all stored chunk vectors
   • Calculate cosine similarity: similarity = dot(query, chunk) / (|query| * |chunk|)
+  • Stored chunks and the query are both unit length (normalized at
+    ingestion / encode time), so cosine is just dot(query, chunk)
   • Similarity ranges from 0 (unrelated) to 1 (identical meaning)
 
   Example results:
@@ -83,6 +85,10 @@ STEP 4: Retrieve Top-K Chunks
   • Sort by similarity score
   • Take top 3 chunks (configurable)
   • Filter by minimum score (default: 0.3)
+  • Re-ranking a bigger pool (50-100 candidates)? Don't sort all of it:
+      idx = np.argpartition(-scores, top_k)[:top_k]   # O(N), in C
+      idx = idx[np.argsort(-scores[idx])]             # order just top_k
+    (scores = contiguous np.float32 array; needs top_k < len(scores))
 
 STEP 5: Format Results
   Return:
@@ -194,6 +200,21 @@ embedding_model = "all-MiniLM-L6-v2"
   • 384 dimensions
   • Fast and accurate
 
+collection metadata (HNSW index settings)
+  • Passed once to client.get_or_create_collection(..., metadata={
+        "hnsw:space": "ip",            # inner product: vectors are unit length
+        "hnsw:construction_ef": 200,   # build quality (ingest only)
+        "hnsw:M": 32,                  # links per node: higher = better recall
+        "hnsw:search_ef": 40,          # candidates checked per query
+    })
+  • search_ef is the speed/recall knob: keep it ≥ 2 × top_k
+  • Small campus corpus: these beat the defaults on recall per query cost
+  • space and M are fixed at creation (re-ingest to change them)
+  • "ip" gives the same ranking as "cosine" on unit vectors without the
+    norm math; Chroma's ip distance is 1 - dot, so similarity = 1 - distance
+    still holds. Only valid if EVERY vector (chunks and queries) is
+    normalized: encode(..., normalize_embeddings=True)
+
 ⚡ PERFORMANCE:
 ─────────────────────────────────────────────────────────────────────────
 Query Speed:
@@ -210,7 +231,63 @@ Memory Usage:
 Scalability:
   • ChromaDB handles millions of documents
   • For production: consider managed ChromaDB or Pinecone
-  • Can implement caching for frequent queries
+  • Can implement caching for frequent queries:
+      - Key: query.strip().lower() (+ top_k, min_score for results)
+      - RAGSystem keeps two bounded LRU caches (OrderedDict, ~4096
+        entries, guarded by a threading.Lock):
+          query → embedding, and (query, top_k, min_score) → results
+      - Hit = no encoder call and no HNSW search (sub-millisecond)
+      - Clear the results cache after re-ingesting documents
+      - diskcache can persist it across restarts if needed
+  • Concurrent requests: searching only READS the HNSW index, and the
+    C++ search releases the GIL, so parallel searches need no lock:
+      - async endpoint: await asyncio.to_thread(rag.search_documents, q)
+      - many queries at once: search_documents_batch(queries) can pass
+        them all to ONE collection.query(query_texts=queries, ...), or
+        fan out with ThreadPoolExecutor(max_workers=os.cpu_count())
+
+Speed-ups:
+  • Native HNSW build: the chroma-hnswlib wheel is compiled for any CPU
+    and skips AVX2/AVX-512. On the server, rebuild it for the host CPU:
+      pip install --no-binary :all: chroma-hnswlib
+    Same API, faster distance math inside search_documents()
+  • Re-ranking retrieved chunks yourself? Keep their vectors in ONE
+    contiguous float32 matrix of shape (N, 384) and score them in a
+    single batched call with simsimd (SIMD kernels), not a Python loop
+    over numpy.dot / sklearn cosine_similarity:
+      similarity = 1 - simsimd.cdist(query_vec, chunk_matrix,
+                                     metric="cosine")
+    Use the same helper for the min_score filter and for top-k
+  • int8 vectors: Embedding.set_quantized() (db/models.py) keeps a 4x
+    smaller int8 copy. Quantize the query the same way, shortlist the
+    top ~50 with simsimd's "i8" cosine, then re-score only those 50 in
+    float32 to pick the final top-k (recall stays the same)
+  • CPU query encoder: sentence-transformers can run the model on ONNX
+    Runtime directly, no manual export needed:
+      SentenceTransformer("all-MiniLM-L6-v2", backend="onnx",
+          model_kwargs={"file_name": "onnx/model_qint8_avx512.onnx"})
+    Create it once inside the get_rag_system() singleton; if loading the
+    ONNX file fails, fall back to the normal PyTorch model
+  • Many users at once: run the encoder as a separate service with
+    HuggingFace Text Embeddings Inference (TEI), which batches queries
+    from different users into one forward pass:
+      docker run ... ghcr.io/huggingface/text-embeddings-inference \\
+        --model-id sentence-transformers/all-MiniLM-L6-v2 \\
+        --max-batch-tokens 16384
+    search_documents() then POSTs {"inputs": query} to http://tei/embed
+    (async httpx). Log the time of that call separately from the search
+  • Shorter vectors for the first pass: index the first 128 dims
+    (re-normalized) in the Chroma collection, keep the full 384-dim
+    vector alongside, fetch the top ~50 and re-rank them with the full
+    vectors. ~3x less index memory and distance math. MiniLM was NOT
+    trained for truncation (Matryoshka models are), so check recall on
+    real campus queries before switching
+  • Compact after many re-ingests: deleted/replaced chunks leave holes
+    in the HNSW graph (more RAM, slower queries). RAGSystem.compact()
+    can read every id/embedding/document/metadata, delete the
+    collection, recreate it with the same metadata and add everything
+    back in batches. Run it weekly or after big PDF updates (cron or
+    apscheduler) and log process RSS (psutil) before/after
 
 🎓 WHY RAG OVER ALTERNATIVES?
 ─────────────────────────────────────────────────────────────────────────
@@ -236,6 +313,13 @@ Scalability:
 • ChromaDB handles embedding automatically (no manual work!)
 • Singleton pattern avoids re-initializing on every query
 • Distance → Similarity conversion: similarity = 1 - distance
+  Do it for the whole result list at once, not per result in a loop:
+      dists = np.asarray(results['distances'][0], dtype=np.float32)
+      sims = 1.0 - dists
+      keep = np.where(sims >= min_score)[0]
+      docs = [results['documents'][0][i] for i in keep]
+      metas = [results['metadatas'][0][i] for i in keep]
+  sims stays a contiguous float32 array for top-k / re-ranking
 • Lower distance = higher similarity
 • ChromaDB returns distances, we convert to similarity scores
 
@@ -182,6 +182,17 @@ LLM CONFIGURATION:
   • Temperature: 0.3 (factual, not creative)
   • Timeout: 120 seconds
 
+NON-BLOCKING CALLS (async endpoints):
+  • One shared client for the whole process, created at import:
+      _HF_CLIENT = httpx.AsyncClient(http2=True, timeout=120,
+          limits=httpx.Limits(max_keepalive_connections=32))
+    Connections (and TLS sessions) are reused across requests
+  • async def generate_rag_response(...) awaits _HF_CLIENT.post(...),
+    so the worker serves other users during the 1-3s wait
+  • With "stream": True, read tokens via resp.aiter_lines() and pass
+    them to a FastAPI StreamingResponse: the user sees text sooner
+  • http2=True needs the h2 package (pip install "httpx[http2]")
+
 FALLBACK STRATEGY:
   If LLM unavailable:
   ✓ Still works! Returns formatted chunks
@@ -202,6 +213,19 @@ Optimization:
   • Context length limit (2000 chars)
   • Top-k retrieval (5 docs max)
   • Query refinement cache (future)
+    - Refinement costs a 1-3s Mistral call; "cgpa rule?" gets refined
+      over and over
+    - ResponseGenerator keeps self._refine_cache = OrderedDict()
+      keyed by query.strip().lower(), max 2048 entries
+    - refine_query(): on a hit, move_to_end() and return; on a miss,
+      call the LLM, store the result, popitem(last=False) when full
+    - Only cache successful refinements (not the original query
+      returned after an API error)
+    - Log hits/misses to see if it pays off; diskcache can persist it
+  • Searching with BOTH the original and the refined query? Encode them
+    in one call: encode([original, refined], normalize_embeddings=True),
+    pass both vectors to ONE collection.query(query_embeddings=...),
+    then merge the two result lists and drop duplicate chunk ids
 
 Token Usage (HuggingFace Free Tier):
   • Context: ~500 tokens
@@ -220,6 +244,9 @@ Token Usage (HuggingFace Free Tier):
    Combines multiple chunks into coherent context
    Limits length to avoid token overflow
    Labels sources: [Source 1], [Source 2]
+   Build it with a list + "\\n\\n".join(parts), not context += chunk
+   (each += copies the whole string again). Stop adding parts once the
+   running length reaches 2000, then slice the joined string to 2000
 
 3. CONFIDENCE SCORING
    Averages relevance scores from top-3 chunks
@@ -290,6 +317,10 @@ Methods:
 • Works without LLM but responses less natural
 • Context limited to 2000 chars (prevents token overflow)
 • Query refinement only for queries >3 words (efficiency)
+  - Count words with len(query.split()) <= 3 → skip; never run a
+    tokenizer or the encoder just for this check
+  - db_contact / db_location never refine, whatever the length
+    (they don't go through RAG search)
 • Singleton pattern avoids reinitializing LLM
 • All methods return dict format for consistency
 """
@@ -45,6 +45,7 @@ SQLModel automatically converts these Python classes into SQL tables.
 2. Faculty      - Professor information
 3. Canteen      - Campus food outlet contacts
 4. Warden       - Hostel warden information
+   Contact      - Faculty + Warden + Canteen contacts in one table
 5. Building     - Campus building data
 6. Room         - Individual room locations
 7. MessMenu     - Daily hostel food schedules
@@ -65,11 +66,26 @@ Field Types:
   • datetime = Timestamp with date + time
   • date = Date only (no time)
   • dict = JSON object stored in database
+  • bytes = Raw binary blob (e.g. packed vectors)
+  • ZstdText = str stored zstd-compressed (Document.extracted_text)
 
 Field() Parameters:
   • default=None: Column can be empty
   • primary_key=True: Unique identifier for each row
-  • default_factory=datetime.utcnow: Auto-set to current time
+  • server_default=func.now(): The DATABASE fills in the current time
+    (CURRENT_TIMESTAMP, UTC) on insert, so inserts can leave it out
+  • index=True: B-tree index, so WHERE col = ... is a lookup, not a scan
+  • unique=True: No two rows may share the value (also indexed)
+  • foreign_key="document.id": Column points at a row in another table
+
+Relationship() Parameters:
+  • notice.document / document.notices: Python attributes that follow
+    the foreign key (no column of their own)
+  • back_populates="...": keeps both sides in sync
+  • Lists of related rows are loaded lazily, one query per parent row.
+    Loading many parents? Load the children in ONE extra query:
+        select(Notice).options(selectinload(Notice.document))
+        (selectinload comes from sqlalchemy.orm)
 
 💡 EXAMPLE USAGE:
 ─────────────────────────────────────────────────────────────────────────
@@ -126,6 +142,11 @@ Adding a column to existing table:
 • Actual data lives in campus_companion.db file
 • Changes here require database re-initialization
 • Use Optional[] for nullable columns, plain type for required
+• Column order: required (NOT NULL) columns first, then Optional ones,
+  then large text/blob columns last. SQLite reads a row's columns in
+  order, so queries that skip the big columns stop reading early
+• Indexes are only created with new tables: drop campus_companion.db
+  and re-run init_db() (or use Alembic) after changing them
 """
 
 
@@ -133,13 +154,48 @@ Adding a column to existing table:
 
 # IMPORTING REQUIRED MODULES
 
+import hashlib
 from typing import Optional
 from datetime import datetime,date
 
-from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import JSON as SAJSON
+import numpy as np
+import zstandard
 
+from pydantic import BaseModel, ConfigDict
+from sqlmodel import SQLModel, Field, Column, Relationship
+from sqlalchemy import JSON, DateTime, Index, LargeBinary, TypeDecorator, func
 
+from .vector_store import int8_dot
+
+
+
+
+# ============================================================================
+# COMPRESSED TEXT COLUMN TYPE
+# ============================================================================
+
+class ZstdText(TypeDecorator):
+    """
+    str in Python, zstd-compressed bytes in SQLite.
+
+    Parsed PDF text compresses ~3-5x, so the file is smaller and reads
+    move fewer bytes. SQL LIKE can't search it (SQLite only sees
+    compressed bytes); full-text search goes through document_fts,
+    which db/session.py fills from Python with the decompressed text.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    # One-shot functions: (de)compressor objects aren't safe to share between threads
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zstandard.compress(value.encode("utf-8"), 3)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return zstandard.decompress(value).decode("utf-8")
 
 
 # WE WILL START CREATING DATABASE TABLES NOW
@@ -150,10 +206,12 @@ from sqlalchemy import JSON as SAJSON
 
 class User(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    name: Optional[str] = None 
-    email: str
+    email: str = Field(index=True, unique=True)  # login lookup
     role: str = "student"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )  # set by SQLite on insert
+    name: Optional[str] = None 
 
 
 
@@ -164,9 +222,9 @@ class User(SQLModel, table=True):
 class Faculty(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
-    department : str
+    department : str = Field(index=True)  # "all CSE faculty" lookups
     office_location: str
-    email: str
+    email: str = Field(index=True)
     phone: Optional[str] = None
 
 
@@ -186,7 +244,7 @@ class Canteen(SQLModel, table=True):
         location: Physical location description
     """
     id: Optional[int] = Field(default=None, primary_key=True)
-    name: str  # Required - canteen must have a name
+    name: str = Field(index=True)  # Required - canteen must have a name
     phone: str  # Contact for orders/queries
     email: Optional[str] = None  # Contact email
     location: Optional[str] = None  # Where it's located on campus
@@ -207,9 +265,40 @@ class Warden(SQLModel, table=True):
     """
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str  # Required - warden's name
-    hall: Optional[str] = None  # Which hostel they manage
+    hall: Optional[str] = Field(default=None, index=True)  # Which hostel they manage
     phone: Optional[str] = None  # Emergency contact number
 
+# ============================================================================
+# CONTACT MODEL (all contact kinds in one table)
+# ============================================================================
+
+class Contact(SQLModel, table=True):
+    """
+    One row per contact of ANY kind (faculty, warden, canteen), so a
+    contact lookup is one indexed query instead of three.
+    Filled from the Faculty/Warden/Canteen tables by sync_contacts()
+    in db/session.py.
+
+    Attributes:
+        id: Unique identifier
+        kind: "faculty", "warden" or "canteen"
+        name: Person / outlet name
+        phone: Contact phone number
+        email: Contact email
+        location: Office, hall or outlet location
+        extra: Kind-specific fields as JSON (e.g. {"department": "CSE"})
+    """
+    # (kind, name): each kind's rows sit together, sorted by name
+    __table_args__ = (Index("ix_contact_kind_name", "kind", "name"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str
+    name: str = Field(index=True)  # lookups that don't know the kind
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    location: Optional[str] = None
+    extra: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+
 # ============================================================================
 # BUILDING MODEL
 # ============================================================================
@@ -244,15 +333,15 @@ class Room(SQLModel, table=True):
     Attributes:
         id: Unique identifier
         room_no: Room number (e.g., "AB-201")
+        map_link: URL to Google Maps or campus map
         building: Building name
         floor: Floor number
-        map_link: URL to Google Maps or campus map
     """
     id: Optional[int] = Field(default=None, primary_key=True)
-    room_no: str  # Unique room identifier
+    room_no: str = Field(index=True, unique=True)  # Unique room identifier
+    map_link: str  # Navigation link
     building: Optional[str] = None  # Building name
     floor: Optional[str] = None  # Floor number
-    map_link: str  # Navigation link
 
 # ============================================================================
 # DOCUMENT MODEL
@@ -267,13 +356,37 @@ class Document(SQLModel, table=True):
         title: Document title/name
         department: Which department uploaded it
         storage_path: File path or cloud storage URL
+        sha256: Hex digest of extracted_text (unchanged file = same hash;
+            None when no text was extracted, so empty scans don't collide)
+        text_len: Length of extracted_text in characters
         extracted_text: Text content extracted from PDF (for search)
     """
     id: Optional[int] = Field(default=None, primary_key=True)
     title: Optional[str] = None  # Document name
     department: Optional[str] = None  # Source department
     storage_path: Optional[str] = None  # Where file is stored
-    extracted_text: Optional[str] = None  # OCR/parsed text content
+    sha256: Optional[str] = Field(default=None, index=True, unique=True, max_length=64)
+    text_len: Optional[int] = None
+    extracted_text: Optional[str] = Field(default=None, sa_column=Column(ZstdText))  # OCR/parsed text, stored compressed (large: keep last)
+
+    notices: list["Notice"] = Relationship(back_populates="document")
+    embeddings: list["Embedding"] = Relationship(back_populates="document")
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def set_text(self, text: str):
+        """
+        Store extracted text together with its hash and length.
+
+        Blank text (e.g. a scan where OCR found nothing) gets sha256=None:
+        the column is unique, and every blank PDF would otherwise share
+        one hash.
+        """
+        self.extracted_text = text
+        self.sha256 = self.hash_text(text) if text and text.strip() else None
+        self.text_len = len(text)
 
 # ============================================================================
 # NOTICE MODEL
@@ -291,22 +404,167 @@ class Notice(SQLModel, table=True):
         published_date: When notice was posted
     """
     id: Optional[int] = Field(default=None, primary_key=True)
-    doc_id: Optional[int] = None  # Links to Document.id
+    doc_id: Optional[int] = Field(default=None, index=True, foreign_key="document.id")  # Links to Document.id
     title: Optional[str] = None  # Notice title
     summary: Optional[str] = None  # Short description
     published_date: Optional[date] = None  # Publication date
 
+    document: Optional[Document] = Relationship(back_populates="notices")
+
 # ============================================================================
 # EMBEDDING MODEL
 # ============================================================================
 
+def unit_vector(vector) -> np.ndarray:
+    """float32 copy of `vector` scaled to length 1 (all-zero vectors stay zero)."""
+    v = np.array(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(v))
+    if norm:
+        v /= norm
+    return v
+
+
 class Embedding(SQLModel, table=True):
+    # Chunks are read back per document, in order: (doc_id, chunk_index)
+    __table_args__ = (Index("ix_emb_doc_chunk", "doc_id", "chunk_index"),)
+
     id: Optional[int] = Field(default=None , primary_key=True)
-    doc_id: Optional[int] = None
     chunk_index: int=0
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )  # set by SQLite on insert
+    doc_id: Optional[int] = Field(default=None, foreign_key="document.id")
+    embedding_scale: Optional[float] = None  # int8 value * scale ≈ original float
     text_chunk: Optional[str]=None
-    embedding: Optional[list]= Field(default=None, sa_column=Column(SAJSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    embedding_q8: Optional[bytes] = None  # int8 copy: 384 bytes instead of 1536
+    embedding: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary))  # packed float32: 1536 bytes for 384 dims
+
+    document: Optional[Document] = Relationship(back_populates="embeddings")
+
+    def set_vec(self, vector):
+        """Store `vector` as raw unit-length float32 bytes (no JSON encoding)."""
+        self.embedding = unit_vector(vector).tobytes()
+
+    def get_vec(self):
+        """float32 vector read straight from the stored bytes (None if not stored)."""
+        if self.embedding is None:
+            return None
+        return np.frombuffer(self.embedding, dtype=np.float32)
+
+    def set_quantized(self, vector):
+        """Store an int8 copy of unit-length `vector` with one float scale for the whole vector."""
+        v = unit_vector(vector)
+        peak = float(np.abs(v).max()) or 1.0
+        self.embedding_scale = peak / 127.0
+        self.embedding_q8 = np.round(v / self.embedding_scale).astype(np.int8).tobytes()
+
+    def dequantized(self):
+        """Approximate float32 vector rebuilt from the int8 copy (None if not stored)."""
+        if self.embedding_q8 is None:
+            return None
+        return np.frombuffer(self.embedding_q8, dtype=np.int8).astype(np.float32) * self.embedding_scale
+
+    @staticmethod
+    def q8_matrix(rows):
+        """
+        Pack the rows' int8 copies into one contiguous (N, dim) int8 matrix
+        plus an (N,) float32 scale array. Build once, score many queries.
+
+        Every row needs its int8 copy (set_quantized()); raises ValueError
+        naming the rows that don't have one.
+        """
+        if not rows:
+            return np.empty((0, 0), dtype=np.int8), np.empty(0, dtype=np.float32)
+        missing = [r.id for r in rows if r.embedding_q8 is None or r.embedding_scale is None]
+        if missing:
+            raise ValueError(
+                f"Embedding rows {missing[:10]} have no int8 copy; call set_quantized() first"
+            )
+        matrix = np.frombuffer(b"".join(r.embedding_q8 for r in rows), dtype=np.int8)
+        scales = np.array([r.embedding_scale for r in rows], dtype=np.float32)
+        return matrix.reshape(len(rows), -1), scales
+
+    @staticmethod
+    def score_quantized(query_vec, matrix, scales):
+        """
+        Cosine scores of `query_vec` against a q8_matrix() (rows are stored
+        unit length; the query is normalized here).
+
+        The query is quantized the same way; the int8 dot products run in
+        int8_dot() (db/vector_store.py) and are scaled back once:
+            score ≈ (q_query · q_row) * scale_query * scale_row
+
+        Example:
+            matrix, scales = Embedding.q8_matrix(rows)      # once
+            scores = Embedding.score_quantized(query_vec, matrix, scales)
+        """
+        if len(matrix) == 0:
+            return np.empty(0, dtype=np.float32)
+        v = unit_vector(query_vec)
+        q_scale = (float(np.abs(v).max()) or 1.0) / 127.0
+        q = np.round(v / q_scale).astype(np.int8)
+        return int8_dot(matrix, q) * scales * np.float32(q_scale)
+
+
+# ============================================================================
+# READ MODELS (responses only)
+# ============================================================================
+# Plain frozen Pydantic models for rows that are only read and returned:
+# no SQLAlchemy instance state, can't be modified by accident. Build them
+# without re-validation from trusted rows:
+#     rows = session.execute(select(Faculty.__table__)).all()
+#     faculty = rows_to_models(FacultyRead, rows)   # db/session.py
+
+class FacultyRead(BaseModel):
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: int
+    name: str
+    department: str
+    office_location: str
+    email: str
+    phone: Optional[str] = None
+
+
+class CanteenRead(BaseModel):
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: int
+    name: str
+    phone: str
+    email: Optional[str] = None
+    location: Optional[str] = None
+
+
+class WardenRead(BaseModel):
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: int
+    name: str
+    hall: Optional[str] = None
+    phone: Optional[str] = None
+
+
+class RoomRead(BaseModel):
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: int
+    room_no: str
+    map_link: str
+    building: Optional[str] = None
+    floor: Optional[str] = None
+
+
+class ContactRead(BaseModel):
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: int
+    kind: str
+    name: str
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    location: Optional[str] = None
+    extra: Optional[dict] = None
 
 
 
@@ -37,6 +37,16 @@ It creates the database engine, manages sessions, and initializes tables.
 2. Provides SessionLocal factory for creating database sessions
 3. init_db() function creates all tables from models.py
 4. Configures SQLite for use with FastAPI (thread safety)
+5. Builds FTS5 full-text indexes for name lookups and document text
+   (fts_search_ids)
+6. bulk_insert() / bulk_add_embeddings(): fast one-transaction ingestion
+7. sync_contacts(): rebuilds the combined Contact table;
+   STMT_* prebuilt lookup statements for the chat handlers
+8. rows_to_models(): cheap read-only model objects from result rows;
+   list_documents_meta() / list_embeddings_meta(): listings that skip
+   the large text and vector columns
+9. Builds a sqlite-vec KNN index over chunk embeddings (vec_search_ids),
+   when the optional sqlite-vec package is installed
 
 💡 KEY CONCEPTS:
 ─────────────────────────────────────────────────────────────────────────
@@ -93,12 +103,41 @@ DATABASE_URL = "sqlite:///./campus_companion.db"
 engine = create_engine(...)
   • check_same_thread=False: Allow multiple threads (needed for FastAPI)
   • echo=False: Don't print SQL queries (set True for debugging)
+  • pool_size=10, max_overflow=20: reuse open connections instead of
+    reconnecting per request (matters most on PostgreSQL/MySQL)
+  • pool_pre_ping=True: silently replace dead connections
+  • pool_recycle=1800: never hand out a connection older than 30 min
+  • query_cache_size=1200: SQLAlchemy keeps the compiled SQL of up to
+    1200 statement shapes, so the same select(Faculty).where(...) is
+    compiled once, not on every request. Build queries the same way
+    each time (values as bound parameters) to keep hitting the cache
+  • json_serializer / json_deserializer: JSON columns are encoded with
+    orjson (several times faster than stdlib json; numpy arrays allowed)
+
+SQLITE_PRAGMAS (applied to every new connection, sync and async)
+  • journal_mode=WAL: reads keep going while a write is in progress
+  • synchronous=NORMAL: fsync at checkpoints only (safe with WAL)
+  • mmap_size=256MB: reads served from memory-mapped pages, no copy
+  • cache_size=-65536: 64 MB page cache instead of the ~2 MB default
+  • temp_store=MEMORY: temporary sort/index data stays in RAM
+  • WAL adds campus_companion.db-wal / -shm files next to the database
+
+get_session()
+  • Context manager around SessionLocal(): commit on success,
+    rollback on error, close (= connection back to the pool) always
 
 SessionLocal = sessionmaker(...)
   • autocommit=False: Manual transaction control (safer)
   • autoflush=False: Manual flush control
+  • expire_on_commit=False: objects stay readable after commit()
   • bind=engine: Connect to our SQLite engine
 
+AsyncSessionLocal = async_sessionmaker(...)
+  • Same database file, opened through aiosqlite
+  • For `async def` endpoints: queries don't block the event loop
+  • expire_on_commit=False: rows stay readable after commit
+  • get_async_session() is the FastAPI dependency that yields one
+
 💻 USAGE EXAMPLES:
 ─────────────────────────────────────────────────────────────────────────
 Example 1: Initialize database (first time)
@@ -106,33 +145,29 @@ Example 1: Initialize database (first time)
     init_db()  # Creates all tables
 
 Example 2: Query in API route
-    from db.session import SessionLocal
+    from db.session import get_session
     from db.models import Canteen
     
     def get_canteen_info(name: str):
-        session = SessionLocal()
-        try:
+        with get_session() as session:  # closed automatically
             canteen = session.query(Canteen).filter(
                 Canteen.name.ilike(f"%{name}%")
             ).first()
             return canteen
-        finally:
-            session.close()  # Always close!
 
 Example 3: Insert data
-    session = SessionLocal()
-    new_warden = Warden(
-        name="Mr. Smith",
-        hall="Hall 12",
-        phone="+91-9876543210"
-    )
-    session.add(new_warden)
-    session.commit()
-    session.close()
+    with get_session() as session:  # commits on success, rolls back on error
+        new_warden = Warden(
+            name="Mr. Smith",
+            hall="Hall 12",
+            phone="+91-9876543210"
+        )
+        session.add(new_warden)
 
 ⚠️ IMPORTANT BEST PRACTICES:
 ─────────────────────────────────────────────────────────────────────────
-• Always close sessions (use try/finally or context manager)
+• Always close sessions: `with get_session() as session:` does it
+  for you (FastAPI routes: Depends(get_db))
 • Each API request should have its own session
 • Don't share sessions between requests
 • Call commit() to save changes
@@ -144,10 +179,30 @@ Example 3: Insert data
 • For production, switch to PostgreSQL/MySQL
 • Database file created automatically on first init_db() call
 • Safe to call init_db() multiple times (won't duplicate tables)
+• init_db() stores a hash of the schema in `schema_meta`; when models
+  haven't changed, later calls return after one quick query
 """
 
+import hashlib
+import re
+import sqlite3
+from contextlib import contextmanager
+
+import numpy as np
+import orjson
+
 from sqlmodel import SQLModel, create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import bindparam, event, insert, select, text
+from sqlalchemy.orm import configure_mappers, sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from .models import Canteen, Contact, Document, Embedding, Faculty, Room, Warden, unit_vector
+
+try:
+    import sqlite_vec  # optional: native KNN search over chunk embeddings
+except ImportError:
+    sqlite_vec = None
 
 # ═══════════════════════════════════════════════════════════════════════
 # DATABASE CONNECTION STRING
@@ -159,29 +214,513 @@ DATABASE_URL= "sqlite:///./campus_companion.db"
 # CREATE DATABASE ENGINE
 # ═══════════════════════════════════════════════════════════════════════
 
+def _json_dumps(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 engine= create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
     echo=False,
+    pool_size=10,         # connections kept open and reused between requests
+    max_overflow=20,      # extra connections allowed during traffic bursts
+    pool_pre_ping=True,   # test a pooled connection before handing it out
+    pool_recycle=1800,    # replace connections older than 30 minutes
+    query_cache_size=1200,  # compiled-SQL cache: repeated select()s skip compilation
+    json_serializer=_json_dumps,     # JSON columns use orjson, not stdlib json
+    json_deserializer=orjson.loads,
+)
+
+# ═══════════════════════════════════════════════════════════════════════
+# SQLITE PRAGMAS (run on every new connection)
+# ═══════════════════════════════════════════════════════════════════════
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",       # readers don't block the writer (and vice versa)
+    "PRAGMA synchronous=NORMAL",     # safe with WAL, far fewer fsyncs
+    "PRAGMA mmap_size=268435456",    # read up to 256 MB straight from the OS page cache
+    "PRAGMA cache_size=-65536",      # 64 MB page cache per connection (negative = KB)
+    "PRAGMA temp_store=MEMORY",      # temp tables / sorts in RAM
 )
 
 
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    cursor = dbapi_conn.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragmas)
 
 # ═══════════════════════════════════════════════════════════════════════
 # CREATE SESSION FACTORY
 # ═══════════════════════════════════════════════════════════════════════
 
-SessionLocal= sessionmaker (autocommit=False, autoflush=False, bind=engine)
+SessionLocal= sessionmaker (autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+@contextmanager
+def get_session():
+    """
+    `with get_session() as session:` one unit of work.
+    Commits if the block succeeds, rolls back if it raises, always closes.
+    """
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def get_db():
+    """FastAPI dependency: one Session per request; close() returns its connection to the pool."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# ═══════════════════════════════════════════════════════════════════════
+# ASYNC ENGINE & SESSION FACTORY (for async FastAPI endpoints)
+# ═══════════════════════════════════════════════════════════════════════
+
+ASYNC_DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
+
+if async_engine.dialect.name == "sqlite":
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+async def get_async_session():
+    """FastAPI dependency: one AsyncSession per request, closed afterwards."""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+# ═══════════════════════════════════════════════════════════════════════
+# FULL-TEXT SEARCH INDEXES (SQLite FTS5)
+# ═══════════════════════════════════════════════════════════════════════
+# `WHERE name LIKE '%roy%'` can't use an index and scans the whole table.
+# Each table below gets a companion `<table>_fts` index that triggers keep
+# in sync, so name lookups become `<table>_fts MATCH '"roy"*'`.
+
+FTS_COLUMNS = {
+    "contact": ("name", "location"),
+    "canteen": ("name", "location"),
+    "faculty": ("name", "department", "office_location"),
+    "warden": ("name", "hall"),
+    "room": ("room_no", "building"),
+}
+
+
+def _fts_statements(table, columns):
+    cols = ", ".join(columns)
+    new_cols = ", ".join(f"new.{c}" for c in columns)
+    old_cols = ", ".join(f"old.{c}" for c in columns)
+    fts = f"{table}_fts"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{table}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_cols}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_cols}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END",
+        # Index rows that existed before the FTS table did
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+# Document text is stored compressed (ZstdText), so FTS5 can't read it
+# from the table itself, and a trigger would need a Python SQL function
+# that other SQLite clients (CLI, DB Browser, plain sqlite3) don't have.
+# `document_fts` is CONTENTLESS (index only, no copy of the text) and is
+# kept in sync from Python instead:
+#   • Session writes: the Document mapper events below
+#   • Raw Core writes (bulk_insert(Document, ...)) or edits made outside
+#     this app: call reindex_document_fts() afterwards
+DOC_FTS_COLUMNS = ("title", "extracted_text")
+
+
+def _doc_fts_statements():
+    cols = ", ".join(DOC_FTS_COLUMNS)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS document_fts USING fts5({cols}, content='')",
+        # Older databases kept document_fts in sync with zstd_text() triggers
+        "DROP TRIGGER IF EXISTS document_fts_ai",
+        "DROP TRIGGER IF EXISTS document_fts_ad",
+        "DROP TRIGGER IF EXISTS document_fts_au",
+    ]
+
+
+# Selecting through the model decompresses extracted_text in Python
+_DOC_FTS_SOURCE = select(Document.id, Document.title, Document.extracted_text)
+_DOC_FTS_ADD = text(
+    "INSERT INTO document_fts(rowid, title, extracted_text) "
+    "VALUES (:id, :title, :extracted_text)"
+)
+# Contentless tables need the exact indexed values to remove a row
+_DOC_FTS_REMOVE = text(
+    "INSERT INTO document_fts(document_fts, rowid, title, extracted_text) "
+    "VALUES ('delete', :id, :title, :extracted_text)"
+)
+
+
+def _doc_fts_apply(conn, stmt, doc_id=None):
+    """Run `stmt` for the stored values of one document (or all of them)."""
+    source = _DOC_FTS_SOURCE if doc_id is None else _DOC_FTS_SOURCE.where(Document.id == doc_id)
+    rows = [row._asdict() for row in conn.execute(source)]
+    if rows:
+        conn.execute(stmt, rows)
+
+
+def _has_doc_fts(conn) -> bool:
+    """True on SQLite databases where create_fts_indexes() has run."""
+    if conn.dialect.name != "sqlite":
+        return False
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = 'document_fts'")
+    ).first() is not None
+
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(Document, "after_insert")
+    @event.listens_for(Document, "after_update")
+    def _doc_fts_index(mapper, connection, target):
+        if _has_doc_fts(connection):
+            _doc_fts_apply(connection, _DOC_FTS_ADD, target.id)
+
+    @event.listens_for(Document, "before_update")
+    @event.listens_for(Document, "before_delete")
+    def _doc_fts_unindex(mapper, connection, target):
+        # Still the old row: the UPDATE/DELETE hasn't run yet
+        if _has_doc_fts(connection):
+            _doc_fts_apply(connection, _DOC_FTS_REMOVE, target.id)
+
+
+def reindex_document_fts():
+    """Rebuild document_fts from the document table (one transaction)."""
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO document_fts(document_fts) VALUES ('delete-all')"))
+        _doc_fts_apply(conn, _DOC_FTS_ADD)
+
+
+def create_fts_indexes():
+    if engine.dialect.name != "sqlite":
+        return  # FTS5 is SQLite-only
+    with engine.begin() as conn:
+        for table, columns in FTS_COLUMNS.items():
+            for stmt in _fts_statements(table, columns):
+                conn.execute(text(stmt))
+
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'document_fts'")
+        ).first()
+        for stmt in _doc_fts_statements():
+            conn.execute(text(stmt))
+        if not exists:
+            # Contentless tables can't 'rebuild': index existing rows once
+            _doc_fts_apply(conn, _DOC_FTS_ADD)
+
+
+def fts_match_query(query: str) -> str:
+    """Turn free text into a safe FTS5 prefix query: 'Roy cant' → '"roy"* OR "cant"*'."""
+    words = re.findall(r"\w+", query.lower())
+    return " OR ".join(f'"{w}"*' for w in words)
+
+
+def fts_search_ids(session, table: str, query: str, limit: int = 5) -> list:
+    """
+    Return ids of the best-matching rows in `table` (best first).
+
+    Example:
+        ids = fts_search_ids(session, "canteen", "roy")
+        rows = session.query(Canteen).filter(Canteen.id.in_(ids)).all()
+
+    table="document" searches document titles + text (BM25 ranked), e.g.
+    as a keyword prefilter before vector re-ranking.
+    """
+    if table not in FTS_COLUMNS and table != "document":
+        raise ValueError(f"No FTS index for table '{table}'")
+
+    match = fts_match_query(query)
+    if not match:
+        return []
+
+    rows = session.execute(
+        text(f"SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH :q "
+             f"ORDER BY rank LIMIT :n"),
+        {"q": match, "n": limit},
+    )
+    return [row[0] for row in rows]
+
+# ═══════════════════════════════════════════════════════════════════════
+# BULK INSERTS (ingestion)
+# ═══════════════════════════════════════════════════════════════════════
+# `session.add(row); session.commit()` per chunk = one transaction (and
+# one disk sync) per row. These helpers write a whole list of plain
+# dicts in ONE transaction with batched multi-row INSERTs.
+
+def bulk_insert(model, rows: list, batch_size: int = 1000):
+    """Insert `rows` (list of column dicts) into `model`'s table in one transaction."""
+    if not rows:
+        return
+    with SessionLocal() as session, session.begin():
+        for start in range(0, len(rows), batch_size):
+            session.execute(insert(model), rows[start:start + batch_size])
+
+
+def bulk_add_embeddings(rows: list, batch_size: int = 1000):
+    """
+    Insert Embedding rows from dicts in one transaction.
+
+    Example:
+        bulk_add_embeddings([
+            {"doc_id": 1, "chunk_index": i, "text_chunk": chunk, "embedding": vec}
+            for i, (chunk, vec) in enumerate(zip(chunks, vectors))
+        ])
+
+    Vectors (numpy arrays, lists or packed bytes) are scaled to unit
+    length and packed to float32 bytes, same as Embedding.set_vec.
+    created_at is filled in by the database.
+    """
+    prepared = []
+    for row in rows:
+        vec = row.get("embedding")
+        if vec is not None:
+            if isinstance(vec, bytes):
+                vec = np.frombuffer(vec, dtype=np.float32)
+            row = {**row, "embedding": unit_vector(vec).tobytes()}
+        prepared.append(row)
+    bulk_insert(Embedding, prepared, batch_size)
+
+# ═══════════════════════════════════════════════════════════════════════
+# CONTACT TABLE SYNC
+# ═══════════════════════════════════════════════════════════════════════
+# Faculty, Warden and Canteen stay the tables you edit; Contact is the
+# combined copy the chat router searches. Re-run after changing them.
+
+CONTACT_SYNC_STATEMENTS = (
+    "DELETE FROM contact",
+    "INSERT INTO contact (kind, name, phone, email, location, extra) "
+    "SELECT 'faculty', name, phone, email, office_location, "
+    "json_object('department', department) FROM faculty",
+    "INSERT INTO contact (kind, name, phone, email, location, extra) "
+    "SELECT 'warden', name, phone, NULL, hall, NULL FROM warden",
+    "INSERT INTO contact (kind, name, phone, email, location, extra) "
+    "SELECT 'canteen', name, phone, email, location, NULL FROM canteen",
+)
+
+
+def sync_contacts():
+    """Rebuild the Contact table from Faculty, Warden and Canteen (one transaction)."""
+    with engine.begin() as conn:
+        for stmt in CONTACT_SYNC_STATEMENTS:
+            conn.execute(text(stmt))
+
+# ═══════════════════════════════════════════════════════════════════════
+# PREBUILT LOOKUP STATEMENTS
+# ═══════════════════════════════════════════════════════════════════════
+# Built once at import; values are bound at execute time, so every call
+# reuses the same compiled SQL from the engine's cache:
+#     session.execute(STMT_FACULTY_BY_DEPT, {"dept": "Mathematics"}).scalars().all()
+#     session.execute(STMT_CANTEEN_BY_NAME, {"pat": "%roy%"}).scalars().first()
+
+STMT_FACULTY_BY_DEPT = select(Faculty).where(Faculty.department == bindparam("dept"))
+STMT_FACULTY_BY_NAME = select(Faculty).where(Faculty.name.ilike(bindparam("pat")))
+STMT_CANTEEN_BY_NAME = select(Canteen).where(Canteen.name.ilike(bindparam("pat")))
+STMT_WARDEN_BY_HALL = select(Warden).where(Warden.hall == bindparam("hall"))
+STMT_ROOM_BY_NO = select(Room).where(Room.room_no == bindparam("room_no"))
+STMT_CONTACT_BY_KIND_NAME = select(Contact).where(
+    Contact.kind == bindparam("kind"), Contact.name.ilike(bindparam("pat"))
+)
+
+# ═══════════════════════════════════════════════════════════════════════
+# READ HELPERS
+# ═══════════════════════════════════════════════════════════════════════
+
+def rows_to_models(model_cls, rows) -> list:
+    """
+    Build model objects from raw result rows WITHOUT Pydantic validation.
+
+    Only for rows read from our own database (the schema already
+    guarantees the types). Never use it on user input. The objects are
+    not attached to a session: read them, don't modify and commit them.
+    For responses, pass a frozen read model (FacultyRead, ContactRead, ...
+    in db/models.py) instead of the table class.
+
+    Example:
+        rows = session.execute(select(Faculty.__table__)).all()
+        faculty = rows_to_models(FacultyRead, rows)   # or Faculty
+
+    Table classes work too: a Core select(Table) never sets up the ORM
+    mappers, so they are configured here first (a no-op once done).
+    The speed-up is for table classes (~5x over model_validate); plain
+    read models validate about as fast, use them for immutability.
+    """
+    if hasattr(model_cls, "__table__"):
+        configure_mappers()
+    return [model_cls.model_construct(**dict(r._mapping)) for r in rows]
+
+
+def list_documents_meta(session, load_full: bool = False) -> list:
+    """
+    List documents WITHOUT Document.extracted_text (can be megabytes each).
+
+    Returns rows with .id, .title, .department, .text_len.
+    load_full=True returns whole Document objects, text included.
+    """
+    if load_full:
+        return session.execute(select(Document)).scalars().all()
+    return session.execute(
+        select(Document.id, Document.title, Document.department, Document.text_len)
+    ).all()
+
+
+def list_embeddings_meta(session, doc_id: int, load_full: bool = False) -> list:
+    """
+    List a document's chunks WITHOUT the vector columns, in chunk order.
+
+    Returns rows with .id, .chunk_index, .text_chunk.
+    load_full=True returns whole Embedding objects, vectors included.
+    """
+    if load_full:
+        stmt = select(Embedding)
+    else:
+        stmt = select(Embedding.id, Embedding.chunk_index, Embedding.text_chunk)
+    stmt = stmt.where(Embedding.doc_id == doc_id).order_by(Embedding.chunk_index)
+
+    result = session.execute(stmt)
+    return result.scalars().all() if load_full else result.all()
+
+# ═══════════════════════════════════════════════════════════════════════
+# VECTOR SEARCH INDEX (sqlite-vec, optional)
+# ═══════════════════════════════════════════════════════════════════════
+# Without it, RAG scoring over Embedding rows means loading every vector
+# into Python. `embedding_vec` is a vec0 virtual table (rowid =
+# Embedding.id) whose KNN search runs in C inside SQLite.
+
+EMBEDDING_DIM = 384
+
+# Some Python builds (e.g. macOS system Python) can't load SQLite extensions
+VEC_AVAILABLE = (
+    engine.dialect.name == "sqlite"
+    and sqlite_vec is not None
+    and hasattr(sqlite3.Connection, "enable_load_extension")
+)
+
+
+if VEC_AVAILABLE:
+    @event.listens_for(engine, "connect")
+    def _load_sqlite_vec(dbapi_conn, connection_record):
+        dbapi_conn.enable_load_extension(True)
+        sqlite_vec.load(dbapi_conn)
+        dbapi_conn.enable_load_extension(False)
+
+
+VEC_INDEX_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS embedding_vec "
+    f"USING vec0(embedding float[{EMBEDDING_DIM}])"
+)
+
+
+def create_vec_index():
+    if not VEC_AVAILABLE:
+        return
+    with engine.begin() as conn:
+        conn.execute(text(VEC_INDEX_DDL))
+
+
+def vec_index_embeddings(session, embeddings):
+    """
+    Add (or replace) Embedding rows in the vector index.
+    Call after the rows are flushed, so each one has an id.
+    """
+    if not VEC_AVAILABLE:
+        raise RuntimeError("sqlite-vec is not available (pip install sqlite-vec)")
+
+    rows = [{"id": e.id, "v": e.embedding} for e in embeddings if e.embedding is not None]
+    if not rows:
+        return
+    session.execute(text("DELETE FROM embedding_vec WHERE rowid = :id"),
+                    [{"id": r["id"]} for r in rows])
+    session.execute(text("INSERT INTO embedding_vec(rowid, embedding) VALUES (:id, :v)"),
+                    rows)
+
+
+def vec_search_ids(session, query_vec, limit: int = 5) -> list:
+    """
+    Return (Embedding.id, distance) pairs nearest to `query_vec` (closest first).
+
+    Example:
+        hits = vec_search_ids(session, embed_query("cgpa rules"), limit=3)
+        chunks = session.query(Embedding).filter(
+            Embedding.id.in_([i for i, _ in hits])).all()
+    """
+    if not VEC_AVAILABLE:
+        raise RuntimeError("sqlite-vec is not available (pip install sqlite-vec)")
+
+    q = np.ascontiguousarray(query_vec, dtype=np.float32).tobytes()
+    rows = session.execute(
+        text("SELECT rowid, distance FROM embedding_vec "
+             "WHERE embedding MATCH :q AND k = :n ORDER BY distance"),
+        {"q": q, "n": limit},
+    )
+    return [(row[0], row[1]) for row in rows]
 
 # ═══════════════════════════════════════════════════════════════════════
 # INITIALIZE DATABASE TABLES FUNCTION
 # ═══════════════════════════════════════════════════════════════════════
 
-def init_db():
-    from . import models
+def _schema_hash() -> str:
+    """Fingerprint of everything init_db() would create (tables, indexes, FTS, vec)."""
+    parts = []
+    for table in SQLModel.metadata.sorted_tables:
+        parts.append(str(CreateTable(table).compile(engine)))
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            parts.append(str(CreateIndex(index).compile(engine)))
+    # The generated DDL itself, so edited trigger/virtual-table SQL counts too
+    for table, columns in sorted(FTS_COLUMNS.items()):
+        parts.extend(_fts_statements(table, columns))
+    parts.extend(_doc_fts_statements())
+    parts.append(VEC_INDEX_DDL if VEC_AVAILABLE else "vec=off")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
 
+def init_db():
+    # Same schema as last time? Skip create_all()'s per-table inspection.
+    schema_hash = _schema_hash()
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS schema_meta (hash TEXT)"))
+        stored = conn.execute(text("SELECT hash FROM schema_meta")).scalar()
+    if stored == schema_hash:
+        print("Database schema up to date")
+        return
 
     SQLModel.metadata.create_all(bind=engine)
+    create_fts_indexes()
+    create_vec_index()
+
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM schema_meta"))
+        conn.execute(text("INSERT INTO schema_meta (hash) VALUES (:h)"), {"h": schema_hash})
 
     print("Database initialised successfully!")
     print("Database location: {DATABASE_URL}")
@@ -0,0 +1,201 @@
+# ================================ DAY - 2 ================================ #
+"""
+╔══════════════════════════════════════════════════════════════════════════╗
+║                        EMBEDDING VECTOR STORE                            ║
+║            All Chunk Vectors in One Memory-Mapped float32 File           ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+📁 FILE ROLE IN PROJECT:
+─────────────────────────────────────────────────────────────────────────
+The Embedding table (db/models.py) keeps one row per chunk, each vector
+packed as float32 bytes. Reading N vectors from it still means N row
+fetches + N np.frombuffer() calls, then stacking them into a matrix.
+
+This file keeps the SAME vectors side by side in one flat file instead:
+
+    embeddings.f32      N × 384 float32 values, row after row
+    embeddings.ids.i64  N int64 Embedding.id values (same order)
+
+or, with quantized=True, 4x smaller:
+
+    embeddings.i8         N × 384 int8 values
+    embeddings.scale.f32  N float32 scales (row ≈ int8 row * scale)
+    embeddings.ids.i64    as above
+
+np.memmap maps the file into memory, so `store.vectors` is an (N, 384)
+array without reading or copying anything up front. Slices are views
+into the file, ready for `matrix @ query`, BLAS or SimSIMD.
+
+💻 USAGE:
+─────────────────────────────────────────────────────────────────────────
+Ingestion (append after the Embedding rows are committed):
+    store = EmbeddingStore()
+    store.append([e.id for e in rows], vectors)   # vectors: (n, 384)
+
+Search / re-rank:
+    scores = store.scores(query_vec)              # cosine: rows are unit length
+    best = store.ids[np.argmax(scores)]           # → Embedding.id
+
+int8 store (same calls, 384 bytes per vector instead of 1536):
+    store = EmbeddingStore(quantized=True)
+
+📝 NOTES:
+─────────────────────────────────────────────────────────────────────────
+• Files are append-only; delete both files and re-ingest to rebuild
+• append() L2-normalizes rows by default: normalize the query the same
+  way and cosine similarity == dot product
+• Metadata (doc_id, chunk_index, text) stays in the Embedding table
+• quantized=True uses the same per-vector scale as
+  Embedding.set_quantized(); cosine scores of unit vectors move by
+  ~2e-3 (query and rows are both int8), which doesn't change MiniLM
+  rankings in practice
+• Give a float32 store and an int8 store DIFFERENT paths: they would
+  share the .ids.i64 file
+"""
+
+import os
+
+import numpy as np
+
+try:
+    import simsimd                  # optional: int8 SIMD dot products
+except ImportError:
+    simsimd = None
+
+BLOCK_ROWS = 4096  # rows per float32 block in the numpy fallback (~6 MB at 384 dims)
+
+
+def int8_dot(matrix, query) -> np.ndarray:
+    """
+    (N,) float32 dot products of an (N, dim) int8 matrix with an int8 query.
+
+    Uses simsimd's int8 kernel when it is installed. Otherwise the rows
+    go through one small float32 buffer, BLOCK_ROWS at a time, so the
+    whole matrix is never copied (results are exact either way: 384 ×
+    127² fits in float32's 24-bit mantissa).
+    """
+    n = len(matrix)
+    if n == 0:
+        return np.empty(0, dtype=np.float32)
+    if simsimd is not None:
+        dots = simsimd.cdist(np.asarray(query, dtype=np.int8)[None, :], matrix,
+                             metric="dot", dtype="int8")
+        return np.asarray(dots, dtype=np.float32)[0]
+
+    q = np.asarray(query, dtype=np.float32)
+    out = np.empty(n, dtype=np.float32)
+    buf = np.empty((min(BLOCK_ROWS, n), matrix.shape[1]), dtype=np.float32)
+    for start in range(0, n, BLOCK_ROWS):
+        block = matrix[start:start + BLOCK_ROWS]
+        rows = buf[:len(block)]
+        rows[...] = block
+        np.dot(rows, q, out=out[start:start + len(block)])
+    return out
+
+
+class EmbeddingStore:
+    """Append-only (N, dim) float32 (or int8) matrix on disk + parallel int64 id file."""
+
+    def __init__(self, path: str = "embeddings", dim: int = 384, quantized: bool = False):
+        self.dim = dim
+        self.quantized = quantized
+        self.dtype = np.int8 if quantized else np.float32
+        self.vectors_path = f"{path}.i8" if quantized else f"{path}.f32"
+        self.scales_path = f"{path}.scale.f32"
+        self.ids_path = f"{path}.ids.i64"
+        self._vectors = None
+        self._scales = None
+        self._ids = None
+
+    def __len__(self):
+        if not os.path.exists(self.ids_path):
+            return 0
+        return os.path.getsize(self.ids_path) // np.dtype(np.int64).itemsize
+
+    def append(self, ids, vectors, normalize: bool = True):
+        """
+        Write `vectors` (n, dim) and their Embedding ids to the end of the files.
+
+        With normalize=True every row is scaled to unit length first, so
+        scoring against a normalized query is a plain dot product.
+        A quantized store then keeps round(row / scale) as int8, with
+        scale = max(|row|) / 127 written to the scales file.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        vectors = np.array(vectors, dtype=np.float32)  # own copy: normalized in place
+        if vectors.shape != (len(ids), self.dim):
+            raise ValueError(
+                f"Expected vectors of shape ({len(ids)}, {self.dim}), got {vectors.shape}"
+            )
+        if normalize:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors /= norms
+
+        if self.quantized:
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0 / 127.0
+            vectors = np.round(vectors / scales[:, None]).astype(np.int8)
+            with open(self.scales_path, "ab") as f:
+                f.write(scales.astype(np.float32).tobytes())
+
+        with open(self.vectors_path, "ab") as f:
+            f.write(vectors.tobytes())
+        with open(self.ids_path, "ab") as f:
+            f.write(ids.tobytes())
+
+        # Files grew: map them again on next access
+        self._vectors = None
+        self._scales = None
+        self._ids = None
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Read-only (N, dim) memmap of all stored vectors (int8 if quantized)."""
+        if self._vectors is None:
+            n = len(self)
+            if n == 0:
+                return np.empty((0, self.dim), dtype=self.dtype)
+            self._vectors = np.memmap(self.vectors_path, dtype=self.dtype,
+                                      mode="r", shape=(n, self.dim))
+        return self._vectors
+
+    @property
+    def scales(self) -> np.ndarray:
+        """Read-only (N,) memmap of per-row int8 scales (quantized stores only)."""
+        if not self.quantized:
+            raise ValueError("scales are only stored for quantized=True")
+        if self._scales is None:
+            n = len(self)
+            if n == 0:
+                return np.empty(0, dtype=np.float32)
+            self._scales = np.memmap(self.scales_path, dtype=np.float32, mode="r", shape=(n,))
+        return self._scales
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Read-only (N,) memmap of Embedding ids, row-aligned with `vectors`."""
+        if self._ids is None:
+            n = len(self)
+            if n == 0:
+                return np.empty(0, dtype=np.int64)
+            self._ids = np.memmap(self.ids_path, dtype=np.int64, mode="r", shape=(n,))
+        return self._ids
+
+    def rows(self, start: int, stop: int) -> np.ndarray:
+        """Zero-copy view of vectors[start:stop] (raw int8 values if quantized)."""
+        return self.vectors[start:stop]
+
+    def scores(self, query_vec) -> np.ndarray:
+        """
+        (N,) float32 dot products of `query_vec` against every stored row.
+
+        Quantized stores quantize the query the same way and score the
+        int8 file directly with int8_dot() (no float32 copy of the matrix).
+        """
+        q = np.asarray(query_vec, dtype=np.float32)
+        if not self.quantized:
+            return self.vectors @ q
+        q_scale = (float(np.abs(q).max()) or 1.0) / 127.0
+        q8 = np.round(q / q_scale).astype(np.int8)
+        return int8_dot(self.vectors, q8) * self.scales * np.float32(q_scale)
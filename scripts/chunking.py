@@ -151,6 +151,35 @@ Smaller Chunks (More Precise):
 • Metadata preserved for traceability
 • If text < chunk_size, returns single chunk
 • Overlap prevents infinite loop (capped at chunk_size-1)
+
+⚡ PERFORMANCE (large PDFs):
+─────────────────────────────────────────────────────────────────────────
+text.split() + " ".join(words[i:i+512]) creates one Python string per
+WORD (~20,000 for a 20k-word PDF) and joins them all again. Work with
+word START OFFSETS instead and cut each chunk with one slice:
+
+    b = text.encode()
+    buf = np.frombuffer(b, dtype=np.uint8)
+    ws = (buf == 32) | (buf == 10) | (buf == 9) | (buf == 13)
+    prev_ws = np.r_[True, ws[:-1]]
+    starts = np.flatnonzero(~ws & prev_ws)        # first byte of each word
+    bounds = np.r_[starts, len(b)]
+    step = chunk_size - chunk_overlap
+    for i in range(0, len(starts), step):
+        end = bounds[min(i + chunk_size, len(starts))]
+        chunk = b[starts[i]:end].decode().strip()
+        ...
+        if i + chunk_size >= len(starts):
+            break
+
+• One numpy pass over the bytes, one slice + decode per CHUNK (~40),
+  no per-word objects
+• Offsets are BYTE offsets: slice the bytes, then decode (slicing the
+  str with them breaks on non-ASCII text)
+• Whitespace inside a chunk is kept as-is; the cleaning step above
+  already collapsed runs of spaces
+• Need fused custom rules (sentence boundaries etc.)? Write the scan
+  as a @numba.njit function over `buf` returning the starts array
 """
 
 # ===========================================================================
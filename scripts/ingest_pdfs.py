@@ -182,12 +182,218 @@ To update documents:
   1. Add/modify PDFs in data/pdfs/
   2. Run: python3 scripts/ingest_pdfs.py
   3. ChromaDB will ADD new documents (won't delete old)
-  
+
+Make re-runs idempotent with content-derived ids + upsert():
+    chunk_id = hashlib.sha1(chunk_text.encode()).hexdigest()[:16]
+    collection.upsert(ids=chunk_ids, embeddings=embs,
+                      documents=texts, metadatas=metas)
+  • Same chunk text → same id → existing row is overwritten, not
+    duplicated (random/counter ids would add it again on every run)
+  • Identical chunks from two PDFs collapse into one row: include the
+    filename in the hashed string if each PDF needs its own copy
+
+Skip files that haven't changed (embedding is the slow part):
+    doc = Document(title=filename)
+    doc.set_text(text)            # stores text, sha256 and text_len
+    if doc.sha256:                # None for blank text (OCR found nothing)
+        same = session.exec(
+            select(Document).where(Document.sha256 == doc.sha256)).first()
+        if same:                  # same text already ingested
+            if same.title != filename:
+                print(f"  ↷ {filename}: same text as {same.title}, skipped")
+            continue
+    session.add(doc)
+  • sha256 is indexed (unique), so the check is a single lookup
+  • A copy of an ingested PDF under another name is skipped too (adding
+    it would fail on the unique sha256); blank PDFs have no hash and
+    are always added
+  • The hash needs the extracted text, so the PDF is still parsed (or
+    OCR'd). PDFProcessor can skip that too with a stat-keyed cache:
+    see "Re-runs" in scripts/pdf_processor.py
+
+Skip re-embedding chunks that were embedded before:
+    key = hashlib.sha1(chunk_text.encode()).hexdigest()
+    path = cache_dir / f"{key}.npz"
+    if path.exists():
+        vec = np.load(path)['emb']
+    else:
+        todo.append((key, chunk_text))         # encode these in one batch
+    ...
+    np.savez_compressed(cache_dir / f"{key}.npz", emb=vec)
+  • Store them with the upsert() + content id pattern above (the id is
+    key[:16]), so re-runs overwrite instead of duplicating
+  • Only changed chunks reach model.encode()
+
 To start fresh:
   1. Delete: data/rag_docs/ folder
   2. Run: python3 scripts/ingest_pdfs.py
   3. Clean ChromaDB created from scratch
 
+⚡ PERFORMANCE (large batches of PDFs):
+─────────────────────────────────────────────────────────────────────────
+Letting ChromaDB embed inside every add() call encodes in small pieces
+and writes one transaction per call. Instead, embed everything yourself
+first, then add in fixed-size batches:
+
+    texts = [c['text'] for c in all_chunks]          # every chunk, all PDFs
+    lens = [len(t) for t in model.tokenizer(texts, add_special_tokens=False)['input_ids']]
+    order = np.argsort(lens, kind='stable')          # shortest first
+    sorted_texts = [texts[i] for i in order]
+    vecs = model.encode(sorted_texts, batch_size=64,
+                        convert_to_numpy=True, normalize_embeddings=True,
+                        show_progress_bar=True)
+    embs = np.empty_like(vecs)
+    embs[order] = vecs                               # back to original order
+
+    for start in range(0, len(texts), 200):
+        end = start + 200
+        collection.add(ids=ids[start:end],
+                       embeddings=embs[start:end].tolist(),
+                       documents=texts[start:end],
+                       metadatas=metas[start:end])
+
+• Sort ACROSS ALL PDFs, not per file: each batch then holds chunks of
+  near-equal token length, so almost no padding tokens go through the
+  model (20-40% less work on mixed corpora). embs is scattered back, so
+  ids/texts/metas keep their original order and still line up
+• Going further: bucket chunks by TOKEN count (model.tokenizer, no
+  special tokens) into <=64 / <=256 / <=512 and encode each bucket
+  with its own batch size (e.g. 128 for short, 32 for long). Most
+  chunks are full 512-word windows; the short last chunk of each PDF
+  no longer rides in a batch padded to 512 tokens. Scatter results
+  back with the same index map as above
+• Bucketing tokenizes every chunk once to count tokens, then encode()
+  tokenizes it AGAIN. Keep the first result and feed token ids straight
+  to the transformer (model[0].auto_model, model.tokenizer):
+      ids = tok(texts, truncation=True, max_length=512)['input_ids']
+      for batch in batches_sorted_by_len(ids):
+          enc = tok.pad({'input_ids': batch}, return_tensors='pt')
+          with torch.inference_mode():
+              out = auto_model(**enc).last_hidden_state
+          mask = enc['attention_mask'].unsqueeze(-1)
+          emb = (out * mask).sum(1) / mask.sum(1)        # mean pool
+          vecs.append(F.normalize(emb, dim=1).numpy())
+  Save `ids` next to the embeddings in the chunk's .npz cache (see
+  RE-INGESTION) so a re-embed with a new model skips tokenizing too
+• 100-250 rows per add(): few transactions, bounded memory
+• Create the collection WITHOUT embedding_function= so Chroma stores
+  these vectors as-is; queries must then pass query_embeddings from
+  the same model (normalized the same way)
+• sentence-transformers runs on the CPU unless told otherwise. Pick
+  the device once and keep the vectors on it until the end:
+      if torch.cuda.is_available():
+          device = 'cuda'
+      elif torch.backends.mps.is_available():
+          device = 'mps'
+      else:
+          device = 'cpu'
+      model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+      embs = model.encode(texts, batch_size=256 if device == 'cuda' else 32,
+                          convert_to_tensor=True, normalize_embeddings=True,
+                          show_progress_bar=True).cpu().numpy()
+  convert_to_tensor=True skips a GPU→CPU copy per batch; the single
+  .cpu() at the end is the only transfer
+• GPU available? Also encode in half precision (half the bytes per
+  weight and activation, ~1.5-2x faster):
+      if device == 'cuda':
+          model.half()
+  Cosine scores move by ~1e-3, so the FP32 query encoder in
+  core/embeddings.py can stay as it is. Convert to float32
+  (vecs.astype(np.float32)) before handing vectors to Chroma
+• CPU only, many cores? One MiniLM process doesn't keep 8 cores busy.
+  Run one model copy per core group instead:
+      if device == 'cpu':
+          pool = model.start_multi_process_pool(
+              target_devices=['cpu'] * min(4, os.cpu_count()))
+          try:
+              vecs = model.encode_multi_process(sorted_texts, pool,
+                                                batch_size=32,
+                                                normalize_embeddings=True)
+          finally:
+              model.stop_multi_process_pool(pool)
+  Pass sorted_texts (see above) and scatter back the same way, so
+  every worker gets evenly sized batches; 2-4x faster on 4-8 core
+  machines. Each worker loads its own copy of the model (~90 MB), and
+  this pool needs the `if __name__ == "__main__":` guard
+• CPU only? Run MiniLM through ONNX Runtime instead of PyTorch
+  (2-4x faster on short chunks). Export + INT8-quantize once:
+      optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 \\
+          --optimize O3 onnx_minilm/
+      optimum-cli onnxruntime quantize --onnx_model onnx_minilm/ \\
+          --avx512_vnni -o onnx_minilm/        # or --avx2
+  then load it with
+      ORTModelForFeatureExtraction.from_pretrained(
+          'onnx_minilm/', provider='CPUExecutionProvider')
+  and wrap it in an encode(texts) -> np.ndarray (AutoTokenizer, mean-pool
+  over the attention mask, L2-normalize) - the same drop-in wrapper
+  described in core/embeddings.py, so ingestion and queries share it
+
+Overlap the stages instead of extract-all → embed-all → add-all (the
+encoder sits idle during OCR, Chroma sits idle during encoding). Connect
+three stages with bounded queues; None means "no more items":
+
+    chunk_q = queue.Queue(maxsize=1000)       # (id, text, meta)
+    emb_q = queue.Queue(maxsize=8)            # encoded batches
+
+    def embedder():
+        while True:
+            batch = [chunk_q.get()]
+            while batch[-1] is not None and len(batch) < 200:
+                try:
+                    batch.append(chunk_q.get(timeout=0.5))
+                except queue.Empty:
+                    break
+            done = batch[-1] is None
+            items = [b for b in batch if b is not None]
+            if items:
+                ids, texts, metas = zip(*items)
+                vecs = model.encode(list(texts), batch_size=64,
+                                    normalize_embeddings=True)
+                emb_q.put((ids, texts, metas, vecs))
+            if done:
+                emb_q.put(None)
+                return
+
+    def writer():
+        while (item := emb_q.get()) is not None:
+            ids, texts, metas, vecs = item
+            collection.add(ids=list(ids), embeddings=vecs.tolist(),
+                           documents=list(texts), metadatas=list(metas))
+
+  Start embedder() and writer() as threads, feed chunk_q from the
+  extraction pool (put() each chunk as its PDF finishes), then
+  chunk_q.put(None) and join() both threads.
+• Threads are enough here: torch and Chroma's writes release the GIL
+• maxsize bounds memory: a fast extractor blocks instead of queueing
+  the whole corpus
+• Chroma's disk writes (SQLite + index flush) still happen inside this
+  process. To move them out, run Chroma as a server and talk to it
+  asynchronously:
+      chroma run --path data/rag_docs --port 8000 &
+      client = await chromadb.AsyncHttpClient(host='localhost', port=8000)
+      collection = await client.get_or_create_collection(COLLECTION_NAME)
+      await asyncio.gather(*(collection.add(**b) for b in batches[i:i + 4]))
+  (wrap the script in asyncio.run(main())). The encoder keeps working
+  while the server flushes; core/rag.py must then connect with
+  HttpClient to the same server instead of opening data/rag_docs
+• Re-ingesting often (e.g. while editing PDFs)? Every run pays 1-3 s
+  just to import torch and load the model. Keep the model in a small
+  long-lived FastAPI process (same startup pattern as api/main.py)
+  and make this script a thin client:
+      # scripts/ingest_server.py
+      @app.on_event("startup")
+      def load_model():
+          app.state.model = SentenceTransformer('all-MiniLM-L6-v2')
+
+      @app.post("/ingest")
+      def ingest(req: IngestRequest):        # {"path": "data/pdfs"}
+          return run_pipeline(req.path, app.state.model)
+
+      # uvicorn scripts.ingest_server:app --port 8123
+      # here: requests.post('http://localhost:8123/ingest',
+      #                     json={'path': 'data/pdfs'})
+  With the Chroma server above, nothing reloads between runs
+
 📝 IMPORTANT NOTES:
 ─────────────────────────────────────────────────────────────────────────
 • First run downloads embedding model (~90MB) - be patient!
@@ -8,13 +8,37 @@ Usage:
     python3 testdb.py
 """
 
-from db.session import init_db, SessionLocal  # Database initialization and session
+from db.session import engine, init_db, SessionLocal, sync_contacts  # Database initialization and session
 from db import models  # All table models
 from sqlmodel import select  # For building SQL queries
+from sqlalchemy import text  # For raw PRAGMA statements
 from datetime import date  # For today's date
 
 
-def seed_data():
+# Throwaway seeding run: don't wait for fsync on every commit.
+# Set on the one connection the script's session is bound to, and put
+# back to the db/session.py default before that connection returns to
+# the pool. journal_mode stays WAL: switching it would change the
+# database file for everyone.
+SEED_PRAGMA = "PRAGMA synchronous=OFF"
+RESTORE_PRAGMA = "PRAGMA synchronous=NORMAL"
+
+
+def add_missing(session, key, objects):
+    """
+    Queue only the `objects` whose `key` column value isn't in the table yet.
+
+    Room.room_no is unique, so re-running this script used to fail with
+    an IntegrityError; now it just skips rows that are already there.
+    """
+    model = type(objects[0])
+    column = getattr(model, key)
+    values = [getattr(obj, key) for obj in objects]
+    existing = set(session.execute(select(column).where(column.in_(values))).scalars())
+    session.add_all([obj for obj in objects if getattr(obj, key) not in existing])
+
+
+def seed_data(session):
     """
     Seed Sample Data into Database
     
@@ -23,13 +47,10 @@ def seed_data():
     - 1 Canteen
     - 1 Building with 1 Room
     - 1 Mess Menu for today
+
+    Uses the caller's session (shared with run_queries()).
+    Safe to re-run: rows that already exist are skipped (add_missing()).
     """
-    # Initialize database (creates tables if they don't exist)
-    init_db()
-    
-    # Create a new database session
-    session = SessionLocal()
-    
     try:
         # ===================================================================
         # CREATE FACULTY MEMBERS
@@ -53,7 +74,7 @@ def seed_data():
         )
         
         # Add both faculty members to session (queued for insertion)
-        session.add_all([f1, f2])
+        add_missing(session, "email", [f1, f2])
         
         # ===================================================================
         # CREATE CANTEEN
@@ -71,7 +92,7 @@ def seed_data():
             email="wonders@campus.edu",  # ✅ Add email field
             location="Near MAB"
         )
-        session.add_all([c1, c2])  # Queue for insertion
+        add_missing(session, "name", [c1, c2])  # Queue for insertion
         
         # ===================================================================
         # CREATE BUILDING
@@ -83,14 +104,10 @@ def seed_data():
             lat=28.5449,   # ✅ Add latitude if required
             lng=77.1925    # ✅ Add longitude if required
         )
-        session.add(b1)  # Queue for insertion
-        
-        # IMPORTANT: Commit to save building and get its auto-generated ID
-        session.commit()
-        
-        # Refresh b1 to load the ID that database assigned
-        session.refresh(b1)
-        # Now b1.id contains the actual database ID (e.g., 1)
+        add_missing(session, "code", [b1])  # Queue for insertion
+        # No commit here: everything is saved by ONE commit at the end
+        # (one transaction = one fsync). Need b1.id before that? Use
+        # session.flush() - it assigns the ID without committing.
         
         # ===================================================================
         # CREATE ROOM (needs building_id from above)
@@ -108,7 +125,7 @@ def seed_data():
             floor="4th Floor",                 # ✅ Add floor
             map_link="https://maps.example/nab403"
         )
-        session.add_all([r1, r2])  # Queue for insertion
+        add_missing(session, "room_no", [r1, r2])  # Queue for insertion
         
         # ===================================================================
         # Wardens
@@ -124,10 +141,15 @@ def seed_data():
             phone="9434789034"
         )
 
-        session.add_all([w1, w2])
+        add_missing(session, "name", [w1, w2])
 
-        # Commit all remaining changes to database
+        # Commit everything in a single transaction
+        # (for thousands of rows use db.session.bulk_insert(model, rows),
+        # which sends them as executemany batches)
         session.commit()
+
+        # Copy faculty/canteen/warden rows into the combined Contact table
+        sync_contacts()
         
         print("Sample data seeded.")
         
@@ -136,13 +158,9 @@ def seed_data():
         print(f"Error seeding data: {e}")
         import traceback
         traceback.print_exc()
-        
-    finally:
-        # Always close session to free up resources
-        session.close()
 
 
-def run_queries():
+def run_queries(session):
     """
     Run Test Queries to Verify Data
     
@@ -150,10 +168,9 @@ def run_queries():
     1. All faculty members
     2. All canteens
     3. Rooms in building with code "AB"
+
+    Uses the caller's session (shared with seed_data()).
     """
-    # Create new session for querying
-    session = SessionLocal()
-    
     try:
         # ===================================================================
         # QUERY 1: Get all faculty members
@@ -199,10 +216,6 @@ def run_queries():
         print(f" Query error: {e}")
         import traceback
         traceback.print_exc()
-        
-    finally:
-        # Always close session
-        session.close()
 
 
 # ============================================================================
@@ -213,15 +226,30 @@ if __name__ == "__main__":
     Script entry point
     
     Execution flow:
-    1. Seed database with sample data
-    2. Run test queries to display data
+    1. Create tables
+    2. Seed database with sample data
+    3. Run test queries to display data
+    (2 and 3 share one session bound to one connection; sync_contacts()
+    inside seed_data() uses its own pooled connection)
     """
     print("\n" + "="*70)
     print("DATABASE INITIALIZATION")
     print("="*70 + "\n")
     
-    seed_data()      # Insert dummy data
-    run_queries()    # Query and display data
+    # Initialize database (creates tables if they don't exist)
+    init_db()
+
+    # One connection + one session for both steps; both closed at the end
+    with engine.connect() as conn:
+        conn.execute(text(SEED_PRAGMA))
+        conn.commit()  # the session then runs its own transactions on conn
+        try:
+            with SessionLocal(bind=conn) as session:
+                seed_data(session)      # Insert dummy data
+                run_queries(session)    # Query and display data
+        finally:
+            conn.execute(text(RESTORE_PRAGMA))
+            conn.commit()
     
     print("\n" + "="*70)
     print("🎉 DATABASE READY!")